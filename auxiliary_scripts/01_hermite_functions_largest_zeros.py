@@ -24,7 +24,6 @@ NOTE: THIS SCRIPT CAN ONLY BE RUN IF THE DEVELOPER MODE IS ENABLED BY SETTING TH
 
 # === Imports ===
 
-import json
 import os
 import subprocess
 
@@ -53,6 +52,11 @@ DIAGNOSTIC_PLOT_FILE_PATH = "./files/01-02_hermite_functions_largest_zeros.svg"
 SPLINE_SPECS_FILE_PATH = (
     "../src/robust_fourier/hermite_functions/_hermite_largest_roots_spline.py"
 )
+# the path where to store the knots and coefficients of the spline (relative to the
+# current file)
+SPLINE_ARRAYS_FILE_PATH = (
+    "../src/robust_fourier/hermite_functions/_hermite_largest_roots_spline.npz"
+)
 # the template for storing the spline specifications in the Python file
 SPLINE_SPECS_TEMPLATE = """
 \"\"\"
@@ -68,6 +72,9 @@ It should be noted that ``scipy.special.roots_hermite`` only gives roots whose y
 have an absolute tolerance of roughly ``1e-8``, so the approximation error is limited
 by this reference value and not by the spline itself.
 
+The knots and coefficients of the spline are stored in the binary file
+``{arrays_file_name}`` next to this module.
+
 For a diagnostic plot that shows the fit quality, please see
 ``auxiliary_scripts/{diagnostic_plot_file_path}``.
 
@@ -75,17 +82,23 @@ For a diagnostic plot that shows the fit quality, please see
 
 # === Imports ===
 
+import os
+
 import numpy as np
 
 # === Constants ===
 
+# the path to the file with the knots and coefficients of the B-spline
+_SPLINE_ARRAYS_FILE_PATH = os.path.join(os.path.dirname(__file__), "{arrays_file_name}")
+
 # the specifications of the B-spline for the largest zeros of the Hermite functions
 HERMITE_LARGEST_ZEROS_MAX_ORDER = {order_stop}
-HERMITE_LARGEST_ZEROS_SPLINE_TCK = (
-    np.array({knots}),
-    np.array({coefficients}),
-    {degree},
-)
+with np.load(_SPLINE_ARRAYS_FILE_PATH, allow_pickle=False) as _spline_arrays:
+    HERMITE_LARGEST_ZEROS_SPLINE_TCK = (
+        _spline_arrays["knots"],
+        _spline_arrays["coefficients"],
+        {degree},
+    )
 
 """  # noqa: E501
 
@@ -195,8 +208,18 @@ if __name__ == "__main__" and os.getenv("ROBFT_DEVELOPER", "false").lower() == "
         spline_specs_file_path = os.path.join(
             os.path.dirname(__file__), SPLINE_SPECS_FILE_PATH
         )
+        spline_arrays_file_path = os.path.join(
+            os.path.dirname(__file__), SPLINE_ARRAYS_FILE_PATH
+        )
+
+        # the knots and coefficients are stored in a binary file ...
+        np.savez(
+            spline_arrays_file_path,
+            knots=tck[0],  # type: ignore
+            coefficients=tck[1],
+        )
 
-        # the Python-file is created from the template ...
+        # ... while the Python-file that loads them is created from the template ...
         with open(spline_specs_file_path, "w") as spline_specs_file:
             spline_specs_file.write(
                 SPLINE_SPECS_TEMPLATE.format(
@@ -204,8 +227,7 @@ if __name__ == "__main__" and os.getenv("ROBFT_DEVELOPER", "false").lower() == "
                     num_knots=len(tck[0]),
                     max_abs_rel_error=X_MAX_RTOL,
                     diagnostic_plot_file_path=DIAGNOSTIC_PLOT_FILE_PATH,
-                    knots=json.dumps(tck[0].tolist()),  # type: ignore
-                    coefficients=json.dumps(tck[1].tolist()),
+                    arrays_file_name=os.path.basename(spline_arrays_file_path),
                     degree=SPLINE_DEGREE,
                 )
             )
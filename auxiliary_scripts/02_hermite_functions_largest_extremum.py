@@ -23,15 +23,16 @@ NOTE: THIS SCRIPT CAN ONLY BE RUN IF THE DEVELOPER MODE IS ENABLED BY SETTING TH
 
 # === Imports ===
 
-import json
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from math import sqrt as pysqrt
+from typing import Optional, Tuple, Union
 
 import numpy as np
 from matplotlib import pyplot as plt
 from scipy.interpolate import splev, splrep
-from scipy.optimize import minimize
+from scipy.optimize import brentq
 from tqdm import tqdm
 
 from robust_fourier.hermite_functions import (
@@ -58,6 +59,11 @@ DIAGNOSTIC_PLOT_FILE_PATH = "./files/02-02_hermite_functions_largest_extrema.svg
 SPLINE_SPECS_FILE_PATH = (
     "../src/robust_fourier/hermite_functions/_hermite_largest_extrema_spline.py"
 )
+# the path where to store the knots and coefficients of the spline (relative to the
+# current file)
+SPLINE_ARRAYS_FILE_PATH = (
+    "../src/robust_fourier/hermite_functions/_hermite_largest_extrema_spline.npz"
+)
 # the template for storing the spline specifications in the Python file
 SPLINE_SPECS_TEMPLATE = """
 \"\"\"
@@ -71,6 +77,9 @@ The spline is a quintic B-spline with ``{num_knots}`` knots and its maximum abso
 error is ``{max_abs_rel_error:.2e}`` with respect to a numerical optimisation which itself is the
 limiting factor for the accuracy.
 
+The knots and coefficients of the spline are stored in the binary file
+``{arrays_file_name}`` next to this module.
+
 For a diagnostic plot that shows the fit quality, please see
 ``auxiliary_scripts/{diagnostic_plot_file_path}``.
 
@@ -78,29 +87,36 @@ For a diagnostic plot that shows the fit quality, please see
 
 # === Imports ===
 
+import os
+
 import numpy as np
 
 # === Constants ===
 
-# the specifications of the B-spline for the largest zeros of the Hermite functions
+# the path to the file with the knots and coefficients of the B-spline
+_SPLINE_ARRAYS_FILE_PATH = os.path.join(os.path.dirname(__file__), "{arrays_file_name}")
+
+# the specifications of the B-spline for the largest extrema of the Hermite functions
 HERMITE_LARGEST_EXTREMA_MAX_ORDER = {order_stop}
-HERMITE_LARGEST_EXTREMA_SPLINE_TCK = (
-    np.array({knots}),
-    np.array({coefficients}),
-    {degree},
-)
+with np.load(_SPLINE_ARRAYS_FILE_PATH, allow_pickle=False) as _spline_arrays:
+    HERMITE_LARGEST_EXTREMA_SPLINE_TCK = (
+        _spline_arrays["knots"],
+        _spline_arrays["coefficients"],
+        {degree},
+    )
 
 """  # noqa: E501
 
 # whether to overwrite the spline coefficients file
 OVERWRITE_SPLINE_SPECS = True
 
+# the number of worker processes for computing the reference data
+NUM_WORKERS = os.cpu_count() or 1
 # the number of grid points for the initial bracketing of the extremum
-NUM_EVAL = 100
-# the x and gradient tolerances for the optimisation
-OPT_XTOL = 1e-13
-OPT_GTOL = 1e-15
-# the maximum number of iterations for the optimisation
+NUM_EVAL = 16
+# the absolute x-tolerance for the root finding of the first derivative
+OPT_XTOL = 1e-14
+# the maximum number of iterations for the root finding
 MAX_ITER = 100_000
 
 # the orders and spacings of the Hermite functions to evaluate
@@ -119,6 +135,10 @@ ORDERS_AND_SPACINGS = [
 ]
 # the degree of the B-spline
 SPLINE_DEGREE = 5
+# the base 10 logarithms of the bounds for the smoothing value s of the B-spline and
+# the width of this logarithmic bracket at which the search for s is stopped
+SPLINE_LOG10_S_BOUNDS = (-30.0, -10.0)
+SPLINE_LOG10_S_STOP_WIDTH = 0.5  # log10(sqrt(10))
 # the maximum relative tolerance for the extrema evaluated by the spline
 X_MAX_RTOL = 1e-12
 
@@ -126,7 +146,7 @@ X_MAX_RTOL = 1e-12
 
 
 def _hermite_func_first_derivative(
-    x: np.ndarray,
+    x: Union[float, np.ndarray],
     n: int,
 ) -> np.ndarray:
     """
@@ -136,102 +156,134 @@ def _hermite_func_first_derivative(
     """
 
     # the first derivative is given as a weighted sum of the Hermite functions of order
-    # ``n-1`` and ``n+1``
-    return pysqrt(n / 2) * single_hermite_function(x=x, n=n - 1) - pysqrt(
-        (n + 1) / 2
-    ) * single_hermite_function(x=x, n=n + 1)
+    # ``n-1`` and ``n``
+    # NOTE: the weighting is done in-place on the freshly evaluated Hermite functions
+    #       to avoid temporary Arrays
+    hermite_derivative_values = single_hermite_function(x=x, n=n - 1)
+    hermite_derivative_values *= pysqrt(2.0 * n)
+    hermite_values = single_hermite_function(x=x, n=n)
+    hermite_values *= x
+    hermite_derivative_values -= hermite_values
+
+    return hermite_derivative_values
 
 
-def _hermite_func_second_derivative(
+def _fit_weighted_spline(
     x: np.ndarray,
-    n: int,
-) -> np.ndarray:
+    y: np.ndarray,
+    weights: np.ndarray,
+    s_value: float,
+) -> Tuple[Tuple[np.ndarray, np.ndarray, int], np.ndarray, float]:
     """
-    Evaluates the second derivative of the Hermite function of order ``n`` at the
-    position ``x``.
+    Fits a weighted B-spline with the smoothing value ``s_value`` to the data ``y`` at
+    the positions ``x`` and returns its specifications, its values at ``x``, and its
+    maximum absolute weighted error.
 
     """
 
-    # the second derivative is given as a weighted sum of the first derivatives of the
-    # Hermite functions of order ``n-1`` and ``n+1``
-    return pysqrt(n / 2) * _hermite_func_first_derivative(x=x, n=n - 1) - pysqrt(
-        (n + 1) / 2
-    ) * _hermite_func_first_derivative(x=x, n=n + 1)
+    tck = splrep(
+        x=x,
+        y=y,
+        w=weights,
+        k=SPLINE_DEGREE,
+        s=s_value,
+    )
+    y_approx = splev(x=x, tck=tck)
 
+    # the weighted error is computed in-place on a single Array
+    weighted_errors = np.subtract(y, y_approx)
+    weighted_errors *= weights
+    max_abs_weighted_error = np.abs(weighted_errors, out=weighted_errors).max()
+
+    return tck, y_approx, max_abs_weighted_error
 
-def find_hermite_functions_largest_extremum_x(n: int) -> float:
-    """
-    Finds the location of the largest extremum of the Hermite function of order ``n``.
 
+def _get_extremum_bracketing_grid(
+    x_largest_zero: Union[float, np.ndarray],
+    x_fadeout: Union[float, np.ndarray],
+) -> np.ndarray:
     """
+    Computes the grid over which the largest extremum of the Hermite functions is
+    bracketed from their positive largest zeros and fadeout points.
+    For Arrays of these points, one grid per order is returned along the last axis.
 
-    # an initial guess for the location of the largest extremum is made by bracketing it
-    # between the largest zero and the fadeout point
-    x_largest_zero = approximate_hermite_funcs_largest_zeros_x(n=n)[-1]
-    x_fadeout = approximate_hermite_funcs_fadeout_x(n=n)[-1]
+    """
 
-    # the extremum is bracketed between the largest zero and the fadeout point;
-    # over this range, the first derivative of the Hermite function is evaluated and
-    # checked for a sign change
+    # the extremum is bracketed between the largest zero and the fadeout point
     # NOTE: the fadeout point is way too conservative and therefore the bracketing is
     #       done with a smaller range
-    x_values_initial = np.linspace(
+    return np.linspace(
         start=x_largest_zero,
         stop=x_largest_zero + 0.2 * (x_fadeout - x_largest_zero),
         num=NUM_EVAL,
+        axis=-1,
     )
+
+
+def find_hermite_functions_largest_extremum_x(
+    n: int,
+    x_values_initial: Optional[np.ndarray] = None,
+) -> float:
+    """
+    Finds the location of the largest extremum of the Hermite function of order ``n``.
+    The grid for bracketing the extremum can be passed if it was already computed
+    beforehand; otherwise, it is set up here.
+
+    """
+
+    # an initial guess for the location of the largest extremum is made by bracketing it
+    # between the largest zero and the fadeout point
+    if x_values_initial is None:
+        x_values_initial = _get_extremum_bracketing_grid(
+            x_largest_zero=approximate_hermite_funcs_largest_zeros_x(n=n)[-1],
+            x_fadeout=approximate_hermite_funcs_fadeout_x(n=n)[-1],
+        )
+
+    # over the bracketing grid, the first derivative of the Hermite function is
+    # evaluated and checked for a sign change
+    # NOTE: this search is not run in single precision because the Hermite functions
+    #       are evaluated via exponents in which terms of the order of ``log(n!) / 2``
+    #       cancel out; for ``n = 100_000``, the spacing of ``float32`` values at this
+    #       magnitude is already ``0.0625``, i.e., the Hermite function values would be
+    #       off by several percent
     hermite_derivative_values = _hermite_func_first_derivative(
         x=x_values_initial,
         n=n,
     )
 
-    # the sign change is used to find the initial interval of the extremum
-    sign_change_index = np.where(
-        np.sign(hermite_derivative_values[:-1])
-        != np.sign(hermite_derivative_values[1:])
-    )[0][0]
+    # the first sign change is used to find the initial interval of the extremum
+    # NOTE: beyond the largest zero, the first derivative changes its sign only once,
+    #       namely at the extremum, so the grid splits into a leading run of one sign
+    #       and a trailing run of the other one; therefore, the first point whose sign
+    #       differs from the one of the first point marks the end of the interval
+    # NOTE: ``argmax`` returns 0 if there is no sign change at all, which can be
+    #       detected because the first point cannot differ from itself
+    derivative_is_negative = np.signbit(hermite_derivative_values)
+    sign_change_index = np.argmax(derivative_is_negative != derivative_is_negative[0])
 
     # a bounded interval around the sign change is used to find the extremum
-    if sign_change_index.size < 1:
+    if sign_change_index < 1:
         raise RuntimeError("No sign change found for the Hermite function derivative.")
 
     lower_bound, upper_bound = x_values_initial[
-        sign_change_index : sign_change_index + 2
+        sign_change_index - 1 : sign_change_index + 1
     ]
 
-    # the extremum is found via numerical optimisation
-    # NOTE: for the positive x-values, the extremum is a maximum
-    # NOTE: for order 1, the second derivative is not available and the optimisation
-    #       method is changed to "Newton-CG" with a numerical approximation of the
-    #       Hessian
-    if n > 1:
-        opt_method = "trust-exact"
-        opt_kwargs = dict(
-            hess=lambda x: -_hermite_func_second_derivative(x=x, n=n)[0],
-            options=dict(maxiter=MAX_ITER, gtol=OPT_GTOL),
-        )
-    else:
-        opt_method = "Newton-CG"
-        opt_kwargs = dict(
-            hess="3-point",
-            options=dict(maxiter=MAX_ITER, xtol=OPT_XTOL),
-        )
-
-    result = minimize(
-        fun=lambda x: -single_hermite_function(x=x, n=n)[0],
-        jac=lambda x: -_hermite_func_first_derivative(x=x, n=n)[0],
-        x0=(lower_bound + upper_bound) / 2,
-        method=opt_method,
-        **opt_kwargs,
+    # the extremum is found as the root of the first derivative by Brent's method
+    # NOTE: minimising the Hermite function itself would limit the accuracy of the
+    #       position to roughly the square root of the machine precision because the
+    #       function is flat at its extremum, but its first derivative is not
+    # NOTE: the x-tolerance is the only stopping criterion and ``MAX_ITER`` serves as a
+    #       hard guard for which ``brentq`` raises an error; no further checks of the
+    #       result are required because Brent's method never leaves the bracket
+    return brentq(
+        lambda x: _hermite_func_first_derivative(x=x, n=n)[0],
+        a=lower_bound,
+        b=upper_bound,
+        xtol=OPT_XTOL,
+        maxiter=MAX_ITER,
     )
 
-    # a final sanity check is made to ensure that the unbounded optimisation did not
-    # leave its bounds
-    if not (x_largest_zero <= result.x[0] <= x_fadeout):
-        raise RuntimeError("Optimisation result out of bounds.")
-
-    return result.x[0]
-
 
 # === Main ===
 
@@ -255,21 +307,69 @@ if __name__ == "__main__" and os.getenv("ROBFT_DEVELOPER", "false").lower() == "
 
     # otherwise, the reference data is computed
     except (FileNotFoundError, NotADirectoryError):
-        order_start = ORDER_START
-        orders = []
-        for order_end, spacing in ORDERS_AND_SPACINGS:
-            orders.extend(range(order_start, order_end, spacing))
-            order_start = order_end
-
-        orders = np.array(orders, dtype=np.int64)
+        # the orders are assembled from one range per spacing where each range starts
+        # where the previous one ended
+        order_starts = [ORDER_START] + [
+            order_end for order_end, _ in ORDERS_AND_SPACINGS[:-1]
+        ]
+        orders = np.concatenate(
+            [
+                np.arange(order_start, order_end, spacing, dtype=np.int64)
+                for order_start, (order_end, spacing) in zip(
+                    order_starts, ORDERS_AND_SPACINGS
+                )
+            ]
+        )
         outerm_extremum_x_positions = np.empty_like(orders, dtype=np.float64)
 
-        progress_bar = tqdm(total=len(orders), desc="Computing outermost extrema")
-        for idx, n in enumerate(orders):
-            outerm_extremum_x_positions[idx] = (
-                find_hermite_functions_largest_extremum_x(n=n)
+        # the grids for bracketing the extrema are computed once for all orders, i.e.,
+        # the bounds are gathered first and then all grids are set up in one go
+        # NOTE: the Hermite functions themselves cannot be evaluated in such a batched
+        #       fashion, e.g., via ``scipy.special.eval_hermite`` because the Hermite
+        #       polynomials overflow double precision already for orders of a few
+        #       hundred
+        x_largest_zeros = np.array(
+            [
+                approximate_hermite_funcs_largest_zeros_x(n=n)[-1]
+                for n in orders.tolist()
+            ]
+        )
+        x_fadeouts = np.array(
+            [approximate_hermite_funcs_fadeout_x(n=n)[-1] for n in orders.tolist()]
+        )
+        x_values_initial_grids = _get_extremum_bracketing_grid(
+            x_largest_zero=x_largest_zeros,
+            x_fadeout=x_fadeouts,
+        )
+
+        # the Numba-compiled Hermite function is compiled (or loaded from the cache)
+        # once before the workers are started; this way, forked workers inherit the
+        # compiled function and spawned ones find a warm cache instead of all of them
+        # compiling it concurrently on their first call
+        single_hermite_function(x=0.0, n=ORDER_START)
+
+        # the computations for the different orders are independent of each other, so
+        # they are distributed over multiple processes
+        # NOTE: the chunks are chosen such that every worker gets roughly 4 of them to
+        #       balance the load because higher orders take longer to compute
+        # NOTE: offloading this to a GPU, e.g., with CuPy, does not pay off because the
+        #       work per order is dominated by the sequential iterations of the root
+        #       finding rather than by wide evaluations, and a three-term recurrence
+        #       for the Hermite functions would have to be run up to orders of ~1e5
+        #       per grid point; besides, it would add a hard GPU dependency to a script
+        #       that only needs to be run once in a while
+        chunksize = max(1, len(orders) // (4 * NUM_WORKERS))
+        with ProcessPoolExecutor(max_workers=NUM_WORKERS) as executor:
+            results = executor.map(
+                find_hermite_functions_largest_extremum_x,
+                orders.tolist(),
+                x_values_initial_grids,
+                chunksize=chunksize,
             )
-            progress_bar.update(1)
+            for idx, x_extremum in enumerate(
+                tqdm(results, total=len(orders), desc="Computing outermost extrema")
+            ):
+                outerm_extremum_x_positions[idx] = x_extremum
 
         # the reference data is stored
         np.save(
@@ -280,31 +380,64 @@ if __name__ == "__main__" and os.getenv("ROBFT_DEVELOPER", "false").lower() == "
 
     # --- Spline fitting ---
 
-    # the spline is fitted with an ever decreasing smoothing value s until the
-    # maximum absolute error drops below the threshold
-    max_abs_rel_error = np.inf
-    s_value = 1e-10
+    # the spline is fitted with the largest smoothing value s (= fewest knots) for which
+    # the maximum absolute relative error stays below the threshold; the smoothing value
+    # is found by a bisection in logarithmic space
+    # NOTE: the bisection relies on the error decreasing with s, but this only holds
+    #       approximately because the knots are placed anew for every s, so the error
+    #       can rise slightly between neighbouring smoothing values; therefore, the
+    #       result is not guaranteed to be the largest admissible s, but every fit that
+    #       is kept meets the threshold
     weights = np.reciprocal(outerm_extremum_x_positions)  # all > 0
+    log10_s_lower, log10_s_upper = SPLINE_LOG10_S_BOUNDS
     tck = None
     outerm_extremum_x_positions_approx = None
-    while max_abs_rel_error > X_MAX_RTOL and s_value > 1e-30:
-        tck = splrep(
-            x=orders,
-            y=outerm_extremum_x_positions,
-            w=weights,
-            k=SPLINE_DEGREE,
-            s=s_value,
+    s_value = np.nan
+    max_abs_rel_error = np.inf
+    while log10_s_upper - log10_s_lower > SPLINE_LOG10_S_STOP_WIDTH:
+        log10_s_mid = 0.5 * (log10_s_lower + log10_s_upper)
+        tck_mid, outerm_extremum_x_positions_approx_mid, max_abs_rel_error_mid = (
+            _fit_weighted_spline(
+                x=orders,
+                y=outerm_extremum_x_positions,
+                weights=weights,
+                s_value=10.0**log10_s_mid,
+            )
         )
-        outerm_extremum_x_positions_approx = splev(x=orders, tck=tck)
 
-        max_abs_error = np.abs(
-            (outerm_extremum_x_positions - outerm_extremum_x_positions_approx) * weights
-        ).max()
-        s_value /= 10.0**0.25
+        # if the threshold is met, the fit is kept and an even smoother one is tried;
+        # otherwise, the smoothing has to be reduced
+        if max_abs_rel_error_mid <= X_MAX_RTOL:
+            tck = tck_mid
+            outerm_extremum_x_positions_approx = outerm_extremum_x_positions_approx_mid
+            s_value = 10.0**log10_s_mid
+            max_abs_rel_error = max_abs_rel_error_mid
+            log10_s_lower = log10_s_mid
+        else:
+            log10_s_upper = log10_s_mid
+
+    # if the threshold was not met during the bisection, the least smooth spline is
+    # taken, but it has to meet the threshold as well because the generated module
+    # states this threshold as its accuracy
+    if tck is None or outerm_extremum_x_positions_approx is None:
+        s_value = 10.0 ** SPLINE_LOG10_S_BOUNDS[0]
+        tck, outerm_extremum_x_positions_approx, max_abs_rel_error = (
+            _fit_weighted_spline(
+                x=orders,
+                y=outerm_extremum_x_positions,
+                weights=weights,
+                s_value=s_value,
+            )
+        )
+
+    if max_abs_rel_error > X_MAX_RTOL:
+        raise RuntimeError(
+            f"The spline with the smoothing value {s_value=:.2e} has a maximum "
+            f"absolute relative error of {max_abs_rel_error:.2e} which exceeds the "
+            f"threshold of {X_MAX_RTOL:.2e}, please re-adjust the tolerances and "
+            f"smoothing values."
+        )
 
-    assert (
-        tck is not None and outerm_extremum_x_positions_approx is not None
-    ), "No spline was fitted, please re-adjust the tolerances and smoothing values."
     print(
         f"\nFinal number of spline knots: {len(tck[0])} for smoothing value "
         f"{s_value=:.2e}"
@@ -315,8 +448,18 @@ if __name__ == "__main__" and os.getenv("ROBFT_DEVELOPER", "false").lower() == "
         spline_specs_file_path = os.path.join(
             os.path.dirname(__file__), SPLINE_SPECS_FILE_PATH
         )
+        spline_arrays_file_path = os.path.join(
+            os.path.dirname(__file__), SPLINE_ARRAYS_FILE_PATH
+        )
 
-        # the Python-file is created from the template ...
+        # the knots and coefficients are stored in a binary file ...
+        np.savez(
+            spline_arrays_file_path,
+            knots=tck[0],  # type: ignore
+            coefficients=tck[1],
+        )
+
+        # ... while the Python-file that loads them is created from the template ...
         with open(spline_specs_file_path, "w") as spline_specs_file:
             spline_specs_file.write(
                 SPLINE_SPECS_TEMPLATE.format(
@@ -324,14 +467,15 @@ if __name__ == "__main__" and os.getenv("ROBFT_DEVELOPER", "false").lower() == "
                     num_knots=len(tck[0]),
                     max_abs_rel_error=X_MAX_RTOL,
                     diagnostic_plot_file_path=DIAGNOSTIC_PLOT_FILE_PATH,
-                    knots=json.dumps(tck[0].tolist()),  # type: ignore
-                    coefficients=json.dumps(tck[1].tolist()),
+                    arrays_file_name=os.path.basename(spline_arrays_file_path),
                     degree=SPLINE_DEGREE,
                 )
             )
 
         # ... and formatted
-        subprocess.run(["black", spline_specs_file_path])
+        # NOTE: the formatter is run in the background while the diagnostic plot is
+        #       created and only waited for at the end
+        formatter_process = subprocess.Popen(["black", spline_specs_file_path])
 
     # --- Diagnostic plot ---
 
@@ -405,6 +549,10 @@ if __name__ == "__main__" and os.getenv("ROBFT_DEVELOPER", "false").lower() == "
         )
         fig.savefig(diagnostic_plot_file_path)
 
+        # the formatting of the spline specifications has to be finished before the
+        # script can be considered done
+        formatter_process.wait()
+
     plt.show()
 
 
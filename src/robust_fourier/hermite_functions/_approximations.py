@@ -13,6 +13,7 @@ namely
 
 # === Imports ===
 
+from math import lgamma as pylgamma
 from math import log as pylog
 from math import sqrt as pysqrt
 from typing import Optional
@@ -315,14 +316,7 @@ def hermite_funcs_fadeout_x(
     if n > 0:
         sqrt_n = pysqrt(n)
         k_value = 0.7071067811865476 * sqrt_n  # k = sqrt(n / 2)
-        log_n_factorial = np.log(  # log(n!)
-            np.arange(
-                start=1,
-                stop=max(2, n + 1),
-                step=1,
-                dtype=np.int64,
-            )
-        ).sum()
+        log_n_factorial = pylgamma(n + 1.0)  # log(n!) = log(gamma(n + 1))
         log_gamma = (
             0.5 * log_n_factorial
             - 0.5 * n * pylog(2.0)  # log(2 ** (n / 2))
@@ -19,6 +19,7 @@ import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
 from ._numba_funcs import nb_hermite_function_basis as _nb_hermite_function_basis
+from ._numba_funcs import nb_single_hermite_function as _nb_single_hermite_function
 from ._numpy_funcs import _hermite_function_basis as _np_hermite_function_basis
 from ._numpy_funcs import _single_hermite_function as _np_single_hermite_function
 from ._validate import (
@@ -229,6 +230,7 @@ def single_hermite_function(
     n: IntScalar,
     alpha: RealScalar = 1.0,
     x_center: Optional[RealScalar] = None,
+    jit: bool = True,
     validate_parameters: bool = True,
 ) -> NDArray[np.float64]:
     """
@@ -253,6 +255,11 @@ def single_hermite_function(
         The center of the dilated Hermite function.
         If ``None`` or ``0``, the function is centered at the origin.
         Otherwise, the center is shifted to the given value.
+    jit : :class:`bool`, default=``True``
+        Whether to use the Numba-accelerated implementation (``True``) or the
+        NumPy-based implementation (``False``).
+        If Numba is not available, the function silently falls back to the NumPy-based
+        implementation.
     validate_parameters : :class:`bool`, default=``True``
         Whether to validate all the input parameters (``True``) or only ``x``
         (``False``).
@@ -326,7 +333,11 @@ def single_hermite_function(
         alpha=alpha,  # type: ignore
     )
 
-    hermite_function = _np_single_hermite_function(
+    # if requested, the Numba-accelerated implementation is used
+    # NOTE: this does not have to necessarily involve Numba because it can also be
+    #       the NumPy-based implementation under the hood
+    func = _nb_single_hermite_function if jit else _np_single_hermite_function
+    hermite_function = func(  # type: ignore
         x=x_internal,
         n=n,  # type: ignore
     )
@@ -5,10 +5,13 @@ This file is auto-generated by the script ``auxiliary_scripts/02_hermite_functio
 
 This module stores the B-spline specifications for the largest extrema (= outermost
 maximum/minimum) of the first ``100176`` Hermite functions.
-The spline is a quintic B-spline with ``873`` knots and its maximum absolute relative
+The spline is a quintic B-spline with ``486`` knots and its maximum absolute relative
 error is ``1.00e-12`` with respect to a numerical optimisation which itself is the
 limiting factor for the accuracy.
 
+The knots and coefficients of the spline are stored in the binary file
+``_hermite_largest_extrema_spline.npz`` next to this module.
+
 For a diagnostic plot that shows the fit quality, please see
 ``auxiliary_scripts/./files/02-02_hermite_functions_largest_extrema.svg``.
 
@@ -16,1766 +19,22 @@ For a diagnostic plot that shows the fit quality, please see
 
 # === Imports ===
 
+import os
+
 import numpy as np
 
 # === Constants ===
 
-# the specifications of the B-spline for the largest zeros of the Hermite functions
-HERMITE_LARGEST_EXTREMA_MAX_ORDER = 100176
-HERMITE_LARGEST_EXTREMA_SPLINE_TCK = (
-    np.array(
-        [
-            1.0,
-            1.0,
-            1.0,
-            1.0,
-            1.0,
-            1.0,
-            4.0,
-            5.0,
-            6.0,
-            7.0,
-            8.0,
-            9.0,
-            10.0,
-            11.0,
-            12.0,
-            13.0,
-            14.0,
-            15.0,
-            16.0,
-            17.0,
-            18.0,
-            19.0,
-            20.0,
-            21.0,
-            22.0,
-            23.0,
-            24.0,
-            25.0,
-            26.0,
-            27.0,
-            28.0,
-            29.0,
-            30.0,
-            31.0,
-            32.0,
-            33.0,
-            34.0,
-            35.0,
-            36.0,
-            37.0,
-            38.0,
-            39.0,
-            40.0,
-            41.0,
-            42.0,
-            43.0,
-            44.0,
-            45.0,
-            46.0,
-            47.0,
-            48.0,
-            49.0,
-            50.0,
-            51.0,
-            52.0,
-            53.0,
-            54.0,
-            55.0,
-            56.0,
-            57.0,
-            58.0,
-            59.0,
-            60.0,
-            61.0,
-            62.0,
-            63.0,
-            64.0,
-            65.0,
-            66.0,
-            67.0,
-            68.0,
-            69.0,
-            70.0,
-            71.0,
-            72.0,
-            73.0,
-            74.0,
-            75.0,
-            76.0,
-            77.0,
-            78.0,
-            79.0,
-            80.0,
-            81.0,
-            82.0,
-            83.0,
-            84.0,
-            85.0,
-            86.0,
-            87.0,
-            88.0,
-            89.0,
-            90.0,
-            91.0,
-            92.0,
-            93.0,
-            94.0,
-            95.0,
-            96.0,
-            97.0,
-            98.0,
-            99.0,
-            100.0,
-            102.0,
-            104.0,
-            106.0,
-            108.0,
-            110.0,
-            112.0,
-            114.0,
-            116.0,
-            118.0,
-            120.0,
-            122.0,
-            124.0,
-            126.0,
-            128.0,
-            130.0,
-            132.0,
-            134.0,
-            136.0,
-            138.0,
-            140.0,
-            142.0,
-            144.0,
-            146.0,
-            148.0,
-            150.0,
-            152.0,
-            154.0,
-            156.0,
-            158.0,
-            160.0,
-            162.0,
-            164.0,
-            166.0,
-            168.0,
-            170.0,
-            172.0,
-            174.0,
-            176.0,
-            178.0,
-            180.0,
-            182.0,
-            184.0,
-            186.0,
-            188.0,
-            190.0,
-            192.0,
-            194.0,
-            196.0,
-            198.0,
-            200.0,
-            202.0,
-            204.0,
-            206.0,
-            208.0,
-            210.0,
-            212.0,
-            214.0,
-            216.0,
-            218.0,
-            220.0,
-            222.0,
-            224.0,
-            226.0,
-            228.0,
-            230.0,
-            232.0,
-            234.0,
-            236.0,
-            238.0,
-            240.0,
-            242.0,
-            244.0,
-            246.0,
-            248.0,
-            250.0,
-            254.0,
-            258.0,
-            262.0,
-            266.0,
-            270.0,
-            274.0,
-            278.0,
-            282.0,
-            286.0,
-            290.0,
-            294.0,
-            298.0,
-            302.0,
-            306.0,
-            310.0,
-            314.0,
-            318.0,
-            322.0,
-            326.0,
-            330.0,
-            334.0,
-            338.0,
-            342.0,
-            346.0,
-            350.0,
-            354.0,
-            358.0,
-            362.0,
-            366.0,
-            370.0,
-            374.0,
-            378.0,
-            382.0,
-            386.0,
-            390.0,
-            394.0,
-            398.0,
-            402.0,
-            406.0,
-            410.0,
-            414.0,
-            418.0,
-            422.0,
-            426.0,
-            430.0,
-            434.0,
-            438.0,
-            442.0,
-            446.0,
-            450.0,
-            454.0,
-            458.0,
-            462.0,
-            466.0,
-            470.0,
-            474.0,
-            478.0,
-            482.0,
-            486.0,
-            490.0,
-            494.0,
-            498.0,
-            500.0,
-            508.0,
-            516.0,
-            524.0,
-            532.0,
-            540.0,
-            548.0,
-            556.0,
-            564.0,
-            572.0,
-            580.0,
-            588.0,
-            596.0,
-            604.0,
-            612.0,
-            620.0,
-            628.0,
-            636.0,
-            644.0,
-            652.0,
-            660.0,
-            668.0,
-            676.0,
-            684.0,
-            692.0,
-            700.0,
-            708.0,
-            716.0,
-            724.0,
-            732.0,
-            740.0,
-            748.0,
-            756.0,
-            764.0,
-            772.0,
-            780.0,
-            788.0,
-            796.0,
-            804.0,
-            812.0,
-            820.0,
-            828.0,
-            836.0,
-            844.0,
-            852.0,
-            860.0,
-            868.0,
-            876.0,
-            884.0,
-            892.0,
-            900.0,
-            908.0,
-            916.0,
-            924.0,
-            932.0,
-            940.0,
-            948.0,
-            956.0,
-            964.0,
-            972.0,
-            980.0,
-            988.0,
-            996.0,
-            1000.0,
-            1016.0,
-            1032.0,
-            1048.0,
-            1064.0,
-            1080.0,
-            1096.0,
-            1112.0,
-            1128.0,
-            1144.0,
-            1160.0,
-            1176.0,
-            1192.0,
-            1208.0,
-            1224.0,
-            1240.0,
-            1256.0,
-            1272.0,
-            1288.0,
-            1304.0,
-            1320.0,
-            1336.0,
-            1352.0,
-            1368.0,
-            1384.0,
-            1400.0,
-            1416.0,
-            1432.0,
-            1448.0,
-            1464.0,
-            1480.0,
-            1496.0,
-            1512.0,
-            1528.0,
-            1544.0,
-            1560.0,
-            1576.0,
-            1592.0,
-            1608.0,
-            1624.0,
-            1640.0,
-            1656.0,
-            1672.0,
-            1688.0,
-            1704.0,
-            1720.0,
-            1736.0,
-            1752.0,
-            1768.0,
-            1784.0,
-            1800.0,
-            1816.0,
-            1832.0,
-            1848.0,
-            1864.0,
-            1880.0,
-            1896.0,
-            1912.0,
-            1928.0,
-            1944.0,
-            1960.0,
-            1976.0,
-            1992.0,
-            2008.0,
-            2024.0,
-            2040.0,
-            2056.0,
-            2072.0,
-            2088.0,
-            2104.0,
-            2120.0,
-            2136.0,
-            2152.0,
-            2168.0,
-            2184.0,
-            2200.0,
-            2216.0,
-            2232.0,
-            2248.0,
-            2264.0,
-            2280.0,
-            2296.0,
-            2312.0,
-            2328.0,
-            2344.0,
-            2360.0,
-            2376.0,
-            2392.0,
-            2408.0,
-            2424.0,
-            2440.0,
-            2456.0,
-            2472.0,
-            2488.0,
-            2500.0,
-            2532.0,
-            2564.0,
-            2596.0,
-            2628.0,
-            2660.0,
-            2692.0,
-            2724.0,
-            2756.0,
-            2788.0,
-            2820.0,
-            2852.0,
-            2884.0,
-            2916.0,
-            2948.0,
-            2980.0,
-            3012.0,
-            3044.0,
-            3076.0,
-            3108.0,
-            3140.0,
-            3172.0,
-            3204.0,
-            3236.0,
-            3268.0,
-            3300.0,
-            3332.0,
-            3364.0,
-            3396.0,
-            3428.0,
-            3460.0,
-            3492.0,
-            3524.0,
-            3556.0,
-            3588.0,
-            3620.0,
-            3652.0,
-            3684.0,
-            3716.0,
-            3748.0,
-            3780.0,
-            3812.0,
-            3844.0,
-            3876.0,
-            3908.0,
-            3940.0,
-            3972.0,
-            4004.0,
-            4036.0,
-            4068.0,
-            4100.0,
-            4132.0,
-            4164.0,
-            4196.0,
-            4228.0,
-            4260.0,
-            4292.0,
-            4324.0,
-            4356.0,
-            4388.0,
-            4420.0,
-            4452.0,
-            4484.0,
-            4516.0,
-            4548.0,
-            4580.0,
-            4612.0,
-            4644.0,
-            4676.0,
-            4708.0,
-            4740.0,
-            4772.0,
-            4804.0,
-            4836.0,
-            4868.0,
-            4900.0,
-            4932.0,
-            4964.0,
-            4996.0,
-            5000.0,
-            5064.0,
-            5128.0,
-            5192.0,
-            5256.0,
-            5320.0,
-            5384.0,
-            5448.0,
-            5512.0,
-            5576.0,
-            5640.0,
-            5704.0,
-            5768.0,
-            5832.0,
-            5896.0,
-            5960.0,
-            6024.0,
-            6088.0,
-            6152.0,
-            6216.0,
-            6280.0,
-            6344.0,
-            6408.0,
-            6472.0,
-            6536.0,
-            6600.0,
-            6664.0,
-            6728.0,
-            6792.0,
-            6856.0,
-            6920.0,
-            6984.0,
-            7048.0,
-            7112.0,
-            7176.0,
-            7240.0,
-            7304.0,
-            7368.0,
-            7432.0,
-            7496.0,
-            7560.0,
-            7624.0,
-            7688.0,
-            7752.0,
-            7816.0,
-            7880.0,
-            7944.0,
-            8008.0,
-            8072.0,
-            8136.0,
-            8200.0,
-            8264.0,
-            8328.0,
-            8392.0,
-            8456.0,
-            8520.0,
-            8584.0,
-            8648.0,
-            8712.0,
-            8776.0,
-            8840.0,
-            8904.0,
-            8968.0,
-            9032.0,
-            9096.0,
-            9160.0,
-            9224.0,
-            9288.0,
-            9352.0,
-            9416.0,
-            9480.0,
-            9544.0,
-            9608.0,
-            9672.0,
-            9736.0,
-            9800.0,
-            9864.0,
-            9928.0,
-            9992.0,
-            10000.0,
-            10128.0,
-            10256.0,
-            10384.0,
-            10512.0,
-            10640.0,
-            10768.0,
-            10896.0,
-            11024.0,
-            11152.0,
-            11280.0,
-            11408.0,
-            11536.0,
-            11664.0,
-            11792.0,
-            11920.0,
-            12048.0,
-            12176.0,
-            12304.0,
-            12432.0,
-            12560.0,
-            12688.0,
-            12816.0,
-            12944.0,
-            13072.0,
-            13200.0,
-            13328.0,
-            13456.0,
-            13584.0,
-            13712.0,
-            13840.0,
-            13968.0,
-            14096.0,
-            14224.0,
-            14352.0,
-            14480.0,
-            14608.0,
-            14736.0,
-            14864.0,
-            14992.0,
-            15120.0,
-            15248.0,
-            15376.0,
-            15504.0,
-            15632.0,
-            15760.0,
-            15888.0,
-            16016.0,
-            16144.0,
-            16272.0,
-            16400.0,
-            16528.0,
-            16656.0,
-            16784.0,
-            16912.0,
-            17040.0,
-            17168.0,
-            17296.0,
-            17424.0,
-            17552.0,
-            17680.0,
-            17808.0,
-            17936.0,
-            18064.0,
-            18192.0,
-            18320.0,
-            18448.0,
-            18576.0,
-            18704.0,
-            18832.0,
-            18960.0,
-            19088.0,
-            19216.0,
-            19344.0,
-            19472.0,
-            19600.0,
-            19728.0,
-            19856.0,
-            19984.0,
-            20112.0,
-            20240.0,
-            20368.0,
-            20496.0,
-            20624.0,
-            20752.0,
-            20880.0,
-            21008.0,
-            21136.0,
-            21264.0,
-            21392.0,
-            21520.0,
-            21648.0,
-            21776.0,
-            21904.0,
-            22032.0,
-            22160.0,
-            22288.0,
-            22416.0,
-            22544.0,
-            22672.0,
-            22800.0,
-            22928.0,
-            23056.0,
-            23184.0,
-            23312.0,
-            23440.0,
-            23568.0,
-            23696.0,
-            23824.0,
-            23952.0,
-            24080.0,
-            24208.0,
-            24336.0,
-            24464.0,
-            24592.0,
-            24720.0,
-            24848.0,
-            24976.0,
-            25000.0,
-            25256.0,
-            25512.0,
-            25768.0,
-            26024.0,
-            26280.0,
-            26536.0,
-            26792.0,
-            27048.0,
-            27304.0,
-            27560.0,
-            27816.0,
-            28072.0,
-            28328.0,
-            28584.0,
-            28840.0,
-            29096.0,
-            29352.0,
-            29608.0,
-            29864.0,
-            30120.0,
-            30376.0,
-            30632.0,
-            30888.0,
-            31144.0,
-            31400.0,
-            31656.0,
-            31912.0,
-            32168.0,
-            32424.0,
-            32680.0,
-            32936.0,
-            33192.0,
-            33448.0,
-            33704.0,
-            33960.0,
-            34216.0,
-            34472.0,
-            34728.0,
-            34984.0,
-            35240.0,
-            35496.0,
-            35752.0,
-            36008.0,
-            36264.0,
-            36520.0,
-            36776.0,
-            37032.0,
-            37288.0,
-            37544.0,
-            37800.0,
-            38056.0,
-            38312.0,
-            38568.0,
-            38824.0,
-            39080.0,
-            39336.0,
-            39592.0,
-            39848.0,
-            40104.0,
-            40360.0,
-            40616.0,
-            40872.0,
-            41128.0,
-            41384.0,
-            41640.0,
-            41896.0,
-            42152.0,
-            42408.0,
-            42664.0,
-            42920.0,
-            43176.0,
-            43432.0,
-            43688.0,
-            43944.0,
-            44200.0,
-            44456.0,
-            44712.0,
-            44968.0,
-            45224.0,
-            45480.0,
-            45736.0,
-            45992.0,
-            46248.0,
-            46504.0,
-            46760.0,
-            47016.0,
-            47272.0,
-            47528.0,
-            47784.0,
-            48040.0,
-            48296.0,
-            48552.0,
-            48808.0,
-            49064.0,
-            49320.0,
-            49576.0,
-            49832.0,
-            50000.0,
-            50512.0,
-            51024.0,
-            51536.0,
-            52048.0,
-            52560.0,
-            53072.0,
-            53584.0,
-            54096.0,
-            54608.0,
-            55120.0,
-            55632.0,
-            56144.0,
-            56656.0,
-            57168.0,
-            57680.0,
-            58192.0,
-            58704.0,
-            59216.0,
-            59728.0,
-            60240.0,
-            60752.0,
-            61264.0,
-            61776.0,
-            62288.0,
-            62800.0,
-            63312.0,
-            63824.0,
-            64336.0,
-            64848.0,
-            65360.0,
-            65872.0,
-            66384.0,
-            66896.0,
-            67408.0,
-            67920.0,
-            68432.0,
-            68944.0,
-            69456.0,
-            69968.0,
-            70480.0,
-            70992.0,
-            71504.0,
-            72016.0,
-            72528.0,
-            73040.0,
-            73552.0,
-            74064.0,
-            74576.0,
-            75088.0,
-            75600.0,
-            76112.0,
-            76624.0,
-            77136.0,
-            77648.0,
-            78160.0,
-            78672.0,
-            79184.0,
-            79696.0,
-            80208.0,
-            80720.0,
-            81232.0,
-            81744.0,
-            82256.0,
-            82768.0,
-            83280.0,
-            83792.0,
-            84304.0,
-            84816.0,
-            85328.0,
-            85840.0,
-            86352.0,
-            86864.0,
-            87376.0,
-            87888.0,
-            88400.0,
-            88912.0,
-            89424.0,
-            89936.0,
-            90448.0,
-            90960.0,
-            91472.0,
-            91984.0,
-            92496.0,
-            93008.0,
-            93520.0,
-            94032.0,
-            94544.0,
-            95056.0,
-            95568.0,
-            96080.0,
-            96592.0,
-            97104.0,
-            97616.0,
-            98128.0,
-            98640.0,
-            100176.0,
-            100176.0,
-            100176.0,
-            100176.0,
-            100176.0,
-            100176.0,
-        ]
-    ),
-    np.array(
-        [
-            0.9999999989634524,
-            1.4077447209064793,
-            1.8049611048167207,
-            2.221373014992529,
-            2.6421236001277753,
-            3.0685664710984004,
-            3.348980273416355,
-            3.6103231061142043,
-            3.8558724807755995,
-            4.088194686359701,
-            4.309177659405645,
-            4.520326424536688,
-            4.722830882303254,
-            4.917664791828628,
-            5.105630604034818,
-            5.287401405153899,
-            5.463547139949833,
-            5.634555936990309,
-            5.80084929898075,
-            5.962794333076998,
-            6.120713032912298,
-            6.274889583389342,
-            6.4255764020626644,
-            6.572998790970551,
-            6.717358907448607,
-            6.858838903697126,
-            6.997603624060911,
-            7.133802803577705,
-            7.2675729326109035,
-            7.399038851662198,
-            7.528315067420894,
-            7.655506978133621,
-            7.780711728726821,
-            7.904019245334688,
-            8.025512823492917,
-            8.145269882542706,
-            8.263362492577853,
-            8.379857860127132,
-            8.4948188578398,
-            8.60830424907562,
-            8.720369255365195,
-            8.831065663510016,
-            8.94044223029468,
-            9.048544880908794,
-            9.155416945506136,
-            9.261099354439184,
-            9.36563082344517,
-            9.469048013642968,
-            9.571385688569148,
-            9.672676830438558,
-            9.772952831579046,
-            9.872243457399763,
-            9.970577121316454,
-            10.067980866255143,
-            10.164480501077245,
-            10.260100657932433,
-            10.35486487496967,
-            10.448795658273339,
-            10.541914548329057,
-            10.634242170067479,
-            10.725798301206483,
-            10.816601885336842,
-            10.906671181677062,
-            10.996023527673088,
-            11.084675939825777,
-            11.172644340301161,
-            11.259944438886915,
-            11.346591097374114,
-            11.43259879107587,
-            11.517981342204324,
-            11.602752274335288,
-            11.686924237672828,
-            11.770510154875264,
-            11.853521630267993,
-            11.935970577759104,
-            12.01786813360716,
-            12.099225231609465,
-            12.180052389498465,
-            12.260359793178393,
-            12.340157353302423,
-            12.419454553567043,
-            12.498260812007818,
-            12.576584895267795,
-            12.654435770497683,
-            12.731821690530026,
-            12.80875096640966,
-            12.885231546927367,
-            12.96127116992042,
-            13.036877359166445,
-            13.112057424158452,
-            13.186818472733442,
-            13.261167416941396,
-            13.335110981296053,
-            13.408655709478031,
-            13.481807971209511,
-            13.554573968597616,
-            13.626959742258004,
-            13.698971177147401,
-            13.784942574256597,
-            13.884607263248327,
-            13.997655972063042,
-            14.123742719494532,
-            14.262491072260069,
-            14.399929487782998,
-            14.53609435703734,
-            14.671020230710033,
-            14.80474037917597,
-            14.937286416263317,
-            15.068688704471734,
-            15.198976274795355,
-            15.328176971689471,
-            15.456317491620029,
-            15.583423460858066,
-            15.709519487942023,
-            15.834629224878523,
-            15.958775409740097,
-            16.08197993355989,
-            16.20426384160323,
-            16.32564749076614,
-            16.446150313747818,
-            16.56579130257534,
-            16.68458865038959,
-            16.80255981540629,
-            16.919721866872067,
-            17.03609113798342,
-            17.151683524796425,
-            17.266514323965232,
-            17.3805983810177,
-            17.493950046292262,
-            17.60658322505317,
-            17.718511384747377,
-            17.829747579166,
-            17.940304463754853,
-            18.050194313499812,
-            18.159429038013197,
-            18.268020197499773,
-            18.375979015105447,
-            18.483316394620047,
-            18.59004292362651,
-            18.69616890644874,
-            18.8017043645818,
-            18.906658944174108,
-            19.011042286470122,
-            19.114863452361348,
-            19.218131443906238,
-            19.320855048535872,
-            19.42304279322073,
-            19.524702820217946,
-            19.625843401245394,
-            19.72647223713343,
-            19.826597126071842,
-            19.92622548796907,
-            20.025364655546802,
-            20.12402174224105,
-            20.22220370840023,
-            20.31991734102112,
-            20.417169270391767,
-            20.5139659705118,
-            20.610313766174908,
-            20.706218836887466,
-            20.80168722186702,
-            20.896724824281893,
-            20.99133741562351,
-            21.085530639617843,
-            21.17931001647907,
-            21.272680945911453,
-            21.365648712488106,
-            21.458218485065554,
-            21.55039532886689,
-            21.64218420514078,
-            21.733589923351378,
-            21.82461732136685,
-            21.915270953845592,
-            22.023612375935375,
-            22.14937237061751,
-            22.29223703661109,
-            22.45185154205793,
-            22.627826584422355,
-            22.80245872333611,
-            22.975778013802625,
-            23.14781376635123,
-            23.318593918289075,
-            23.48814561240209,
-            23.656494909729727,
-            23.823667021456615,
-            23.989686264917488,
-            24.154576143071466,
-            24.318359366534747,
-            24.48105789763389,
-            24.642692980359843,
-            24.803285176939244,
-            24.96285439083566,
-            25.121419911702088,
-            25.279000405349247,
-            25.43561402394699,
-            25.59127826938573,
-            25.746010239050673,
-            25.899826398269475,
-            26.05274295368556,
-            26.20477527260066,
-            26.355938708576833,
-            26.506247742513402,
-            26.65571699849749,
-            26.80436008130536,
-            26.95219071942423,
-            27.09922196560147,
-            27.245466719100087,
-            27.39093740250688,
-            27.535646190272065,
-            27.679604907919085,
-            27.82282509275381,
-            27.965317983040865,
-            28.107094538172092,
-            28.248165442827318,
-            28.38854112200532,
-            28.528231740231785,
-            28.667247228186408,
-            28.805597265036898,
-            28.94329131223063,
-            29.08033860276295,
-            29.21674815868069,
-            29.352528791090343,
-            29.487689115364685,
-            29.622237540852026,
-            29.75618231353841,
-            29.889531454240167,
-            30.022292859378094,
-            30.154474190824736,
-            30.286083042673056,
-            30.417126650726967,
-            30.547612443451346,
-            30.677547265981186,
-            30.806938162362894,
-            30.935791844192956,
-            31.064114966384746,
-            31.179134109711907,
-            31.31921476806606,
-            31.484015094672852,
-            31.67312701368427,
-            31.88608270244569,
-            32.13467944145123,
-            32.38138108448418,
-            32.62623034997623,
-            32.86926827144323,
-            33.11053444935455,
-            33.35006703633137,
-            33.587902846915675,
-            33.82407740639999,
-            34.05862502013944,
-            34.29157882808949,
-            34.522970861573015,
-            34.752832092014785,
-            34.98119248414509,
-            35.20808103059252,
-            35.433525819939824,
-            35.65755401894827,
-            35.88019204383485,
-            36.10146533961827,
-            36.32139882310398,
-            36.54001626954397,
-            36.75734140811596,
-            36.97339646316631,
-            37.18820372640954,
-            37.40178430979815,
-            37.614159200197,
-            37.82534850789737,
-            38.03537176588,
-            38.24424815923929,
-            38.45199621883533,
-            38.65863403948156,
-            38.86417921889956,
-            39.06864888917621,
-            39.27205976373978,
-            39.47442809863719,
-            39.67576975755715,
-            39.87610019732167,
-            40.07543449487158,
-            40.27378735402782,
-            40.47117312266765,
-            40.667605798935135,
-            40.86309905272828,
-            41.057666222889964,
-            41.251320341593626,
-            41.44407413503744,
-            41.63594003798752,
-            41.82693020111323,
-            42.01705650059069,
-            42.20633054701012,
-            42.394763692147734,
-            42.58236704072395,
-            42.76915144902106,
-            42.95512755229351,
-            43.140305746765804,
-            43.32469619827615,
-            43.50830887561749,
-            43.6911535469139,
-            43.8732397202904,
-            44.0545768598475,
-            44.21711418193234,
-            44.41506759129052,
-            44.647954013624044,
-            44.91519764318696,
-            45.216137596059305,
-            45.5674462263124,
-            45.91607912818692,
-            46.26209637140708,
-            46.605555980737996,
-            46.946513781683635,
-            47.28502364812812,
-            47.62113753744257,
-            47.954905579435334,
-            48.28637619517842,
-            48.61559615596301,
-            48.94261067149502,
-            49.267463455083856,
-            49.590196799243486,
-            49.91085163103975,
-            50.229467580608784,
-            50.54608303385,
-            50.86073518593719,
-            51.17346009878327,
-            51.484292731665775,
-            51.79326702739262,
-            52.10041588937606,
-            52.40577127719232,
-            52.709364215697285,
-            53.011224976392306,
-            53.311382658999435,
-            53.60986591386571,
-            53.90670232669473,
-            54.20191910083742,
-            54.49554216064522,
-            54.787596966926536,
-            55.07810886335517,
-            55.36710146753581,
-            55.6545987134849,
-            55.940623419665336,
-            56.22519799243144,
-            56.50834434705379,
-            56.79008364891732,
-            57.07043670263664,
-            57.34942380220127,
-            57.62706464800518,
-            57.90337858680888,
-            58.17838442685527,
-            58.4521005779468,
-            58.72454500366586,
-            58.995735262964914,
-            59.26568850968176,
-            59.53442151501114,
-            59.80195066620975,
-            60.068292005405915,
-            60.333461180530136,
-            60.59747357368601,
-            60.860344141302065,
-            61.122087594101494,
-            61.3827182896274,
-            61.64225030039941,
-            61.900697398399295,
-            62.158073070903896,
-            62.414390532892824,
-            62.66966271614619,
-            62.923902323831285,
-            63.17712174079584,
-            63.42933320046667,
-            63.68054858638201,
-            63.93077965651387,
-            64.18003781154817,
-            64.42833440541156,
-            64.67568038724073,
-            64.92208668180021,
-            65.16756386607322,
-            65.41212223046837,
-            65.6557723447125,
-            65.89852397668447,
-            66.14038691691925,
-            66.38137128173,
-            66.62148607875001,
-            66.86074096368358,
-            67.0991449603051,
-            67.33670716073333,
-            67.57343634149083,
-            67.8093413282071,
-            68.0444304025374,
-            68.27871239710058,
-            68.51219513983798,
-            68.74488701231692,
-            68.97679587749423,
-            69.207929640661,
-            69.4382959832,
-            69.66790254100242,
-            69.89675669725372,
-            70.11346045676042,
-            70.37499061816125,
-            70.68083199002596,
-            71.03037339389532,
-            71.4229153665278,
-            71.86874139571025,
-            72.31182556221377,
-            72.75221783094949,
-            73.18996665757217,
-            73.62511906585657,
-            74.05772070015226,
-            74.48781588387287,
-            74.91544767138646,
-            75.34065789877454,
-            75.76348723122,
-            76.18397520859051,
-            76.60216028862658,
-            77.0180798872353,
-            77.43177041967161,
-            77.84326733241807,
-            78.25260515056132,
-            78.65981749814632,
-            79.06493711159088,
-            79.46799595959023,
-            79.86902513060288,
-            80.26805500156749,
-            80.66511517736666,
-            81.06023440545867,
-            81.45344116315108,
-            81.84476252526666,
-            82.23422578813737,
-            82.62185693451444,
-            83.00768131307372,
-            83.3917247156729,
-            83.77401066562595,
-            84.15456385520118,
-            84.53340671515177,
-            84.9105633954956,
-            85.28605469207264,
-            85.65990391131864,
-            86.03213117914817,
-            86.402758312364,
-            86.77180523631131,
-            87.13929230936213,
-            87.505238859701,
-            87.86966436631513,
-            88.23258741099183,
-            88.59402656327299,
-            88.95399979213838,
-            89.31252484850836,
-            89.66961901434739,
-            90.02529932098149,
-            90.37958241404958,
-            90.73248461429696,
-            91.08402196078018,
-            91.43421015115236,
-            91.78306460293922,
-            92.13060043562109,
-            92.47683248464222,
-            92.8217753174507,
-            93.16544321055376,
-            93.50785023066084,
-            93.84901006684304,
-            94.18893644292663,
-            94.52764219463828,
-            94.86514110138145,
-            95.20144524554227,
-            95.53656766455263,
-            95.87052053095996,
-            96.20331608674825,
-            96.53496624247906,
-            96.86548275687971,
-            97.19487716769211,
-            97.5231608255834,
-            97.85034489221484,
-            98.17644033336413,
-            98.50145796036783,
-            98.8254083559758,
-            99.14830201374318,
-            99.4138258664068,
-            99.74288931651556,
-            100.13485976558934,
-            100.58896498120612,
-            101.10430146303345,
-            101.73461403243819,
-            102.36105139431335,
-            102.98368424701486,
-            103.60258092775766,
-            104.21780843629033,
-            104.82943011404484,
-            105.43751011796283,
-            106.04210785287977,
-            106.64328349778468,
-            107.24109351467517,
-            107.83559493722314,
-            108.42684123233522,
-            109.01488536825046,
-            109.59977935971638,
-            110.18157257281523,
-            110.7603142895323,
-            111.33605179353695,
-            111.908831521451,
-            112.47869842935809,
-            113.04569660896723,
-            113.60986891297532,
-            114.17125714356112,
-            114.72990217783257,
-            115.28584374793074,
-            115.83912078611776,
-            116.38977119666629,
-            116.93783204588111,
-            117.4833395170212,
-            118.02632895867936,
-            118.56683493095109,
-            119.10489115620139,
-            119.64053073104472,
-            120.17378570857153,
-            120.7046881474353,
-            121.23326778464838,
-            121.75955667279719,
-            122.28358250765007,
-            122.80537534008968,
-            123.3249629781229,
-            123.84237335495709,
-            124.3576335164903,
-            124.87077008733061,
-            125.3818090813491,
-            125.8907760323252,
-            126.39769590700793,
-            126.90259323901672,
-            127.4054920222494,
-            127.90641578387618,
-            128.40538765088036,
-            128.90243021483133,
-            129.3975657362738,
-            129.89081593841976,
-            130.38220223255522,
-            130.8717455270836,
-            131.3594665464134,
-            131.84538515655026,
-            132.32952177189333,
-            132.8118951033664,
-            133.29252504249857,
-            133.77142974353566,
-            134.2486279866171,
-            134.72413776815742,
-            135.19797685048496,
-            135.67016291981514,
-            136.14071264937337,
-            136.6096437024322,
-            137.07697220797672,
-            137.5427138702195,
-            138.00688622001113,
-            138.46950408684646,
-            138.9305824508229,
-            139.39013802517252,
-            139.84818435324533,
-            140.30473710698053,
-            140.68017280642823,
-            141.14544979580444,
-            141.69967447772248,
-            142.3417543932789,
-            143.0704135271487,
-            143.9616435674196,
-            144.84739570778592,
-            145.7277698150825,
-            146.60286236699335,
-            147.47276752657115,
-            148.33757634958073,
-            149.19737732192567,
-            150.05225651669767,
-            150.90229741429746,
-            151.74758126925792,
-            152.58818704164403,
-            153.42419154348306,
-            154.25566949649385,
-            155.08269365012805,
-            155.9053347597391,
-            156.7236618794884,
-            157.53774193244055,
-            158.34764053475197,
-            159.15342174505972,
-            159.95514708178828,
-            160.7528776501195,
-            161.5466723537283,
-            162.33658896373876,
-            163.1226837268042,
-            163.90501158565013,
-            164.68362618635337,
-            165.45857986123346,
-            166.22992382503782,
-            166.99770796268874,
-            167.76198120879218,
-            168.5227911730269,
-            169.2801845823347,
-            170.03420709097932,
-            170.78490311401595,
-            171.53231657047894,
-            172.27648989939,
-            173.01746497525008,
-            173.75528260307192,
-            174.4899830332213,
-            175.2216052602262,
-            175.95018728242923,
-            176.6757676649393,
-            177.39838219876808,
-            178.11806739269946,
-            178.8348588484163,
-            179.54879003348248,
-            180.25989696576877,
-            180.9682108068863,
-            181.67376552462136,
-            182.37659242492884,
-            183.0767234326545,
-            183.77418858623048,
-            184.46901886296757,
-            185.16124405688353,
-            185.85089182217902,
-            186.53799278428374,
-            187.22257299911865,
-            187.9046613476085,
-            188.58428435439387,
-            189.26146842106326,
-            189.93623994937857,
-            190.6086240667559,
-            191.27864663796268,
-            191.94633160344804,
-            192.61170386978796,
-            193.2747869166877,
-            193.93560436118352,
-            194.59417929930808,
-            195.25053426037195,
-            195.90469172412898,
-            196.55667349371996,
-            197.20650115954928,
-            197.8541959380709,
-            198.49977868711426,
-            199.1432699364223,
-            199.78468987530619,
-            200.42405838568368,
-            201.06139500690657,
-            201.696719006341,
-            202.3300493232756,
-            202.96140459624044,
-            203.59080320355136,
-            204.21826321244924,
-            204.84380243036998,
-            205.46743838595202,
-            206.08918834638675,
-            206.7090693179775,
-            207.32709805330632,
-            207.94329105631292,
-            208.55766458720282,
-            209.1702346670787,
-            209.7810170847189,
-            210.39002739767938,
-            210.99728094159232,
-            211.60279283007202,
-            212.20657796278437,
-            212.80865102724323,
-            213.4090265043762,
-            214.00771867185506,
-            214.60474160900586,
-            215.20010919854246,
-            215.7938351337251,
-            216.38593291822204,
-            216.97641587318373,
-            217.56529713768873,
-            218.15258967525767,
-            218.7383062725898,
-            219.32245955140584,
-            219.905061954427,
-            220.48612578502423,
-            221.06566313820528,
-            221.6436860163666,
-            222.22020620357512,
-            222.7017931230351,
-            223.29716267405274,
-            224.00539628365078,
-            224.8253714508278,
-            225.7557731279877,
-            226.88645339116826,
-            228.01152992469738,
-            229.13108537057454,
-            230.24520013050548,
-            231.35395260378752,
-            232.45741985291866,
-            233.55567638491738,
-            234.64879537128695,
-            235.7368485905248,
-            236.8199049471123,
-            237.89803399369353,
-            238.9713011566306,
-            240.039772083879,
-            241.1035104489468,
-            242.16257908373797,
-            243.21703801484117,
-            244.2669476050243,
-            245.3123657647065,
-            246.35335027432828,
-            247.38995635956277,
-            248.42223926927377,
-            249.4502524106097,
-            250.4740484806388,
-            251.49367877111507,
-            252.509193794531,
-            253.5206433344327,
-            254.52807509433512,
-            255.53153718130892,
-            256.53107608303134,
-            257.52673686191315,
-            258.5185653249162,
-            259.5066045096488,
-            260.49089774679334,
-            261.4714876802425,
-            262.448415339765,
-            263.4217215672012,
-            264.3914465839266,
-            265.3576292870521,
-            266.3203084454808,
-            267.2795217308986,
-            268.2353065074855,
-            269.1876990826933,
-            270.1367353993572,
-            271.0824507201771,
-            272.02487959826686,
-            272.96405610403656,
-            273.9000136514821,
-            274.83278513237406,
-            275.762402830967,
-            276.6888985660722,
-            277.61230352919904,
-            278.5326484852743,
-            279.4499636301971,
-            280.3642787013188,
-            281.27562293135287,
-            282.18402510295454,
-            283.0895135015549,
-            283.9921160387235,
-            284.8918600050553,
-            285.7887726798674,
-            286.682879944668,
-            287.5742095287087,
-            288.4627836180099,
-            289.34863340289985,
-            290.23177800991357,
-            291.11224558649764,
-            291.9900587705062,
-            292.86524209619085,
-            293.73781876919924,
-            294.6078120649331,
-            295.4752447401431,
-            296.3401392923395,
-            297.2025178625524,
-            298.06240228240887,
-            298.9198140655431,
-            299.7747744204647,
-            300.62730425261884,
-            301.4774241726801,
-            302.32515450072674,
-            303.17051527711783,
-            304.013526251824,
-            304.8542069293243,
-            305.6925764976783,
-            306.5286539328072,
-            307.36245794401515,
-            308.1940069340548,
-            309.0233191554659,
-            309.85041247326205,
-            310.6753047412588,
-            311.49801326707205,
-            312.3185554622444,
-            313.13694826018826,
-            313.95320841214277,
-            314.7113802585266,
-            315.63020984163995,
-            316.7082527600985,
-            317.9437823682811,
-            319.3348058442206,
-            320.9337214009991,
-            322.524713293738,
-            324.10789841921235,
-            325.68339012354045,
-            327.25130005171485,
-            328.8117360761511,
-            330.36480478556996,
-            331.9106083536833,
-            333.44924945741593,
-            334.98082503801976,
-            336.5054326272676,
-            338.02316599263287,
-            339.5341174596983,
-            341.0383771140114,
-            342.5360329529544,
-            344.027171551087,
-            345.51187643763126,
-            346.9902307727774,
-            348.46231668615263,
-            349.9282096109555,
-            351.3879915557593,
-            352.8417343564034,
-            354.2895146795238,
-            355.7314050155474,
-            357.1674757464356,
-            358.59779761640954,
-            360.02243861608446,
-            361.4414663832466,
-            362.8549459321207,
-            364.26294307078996,
-            365.66551993158845,
-            367.0627391967625,
-            368.45466164969554,
-            369.8413473234422,
-            371.22285445893954,
-            372.59924094998894,
-            373.97056317835336,
-            375.33687669156853,
-            376.69823594269826,
-            378.0546944562374,
-            379.4063047447688,
-            380.75311848495454,
-            382.09518625715646,
-            383.43255806706543,
-            384.76528268161366,
-            386.09340832241554,
-            387.4169822165321,
-            388.7360508749936,
-            390.050659956356,
-            391.3608544246842,
-            392.66667843561186,
-            393.96817542396155,
-            395.26538813780854,
-            396.5583586018469,
-            397.847128155007,
-            399.13173748949714,
-            400.41222662704706,
-            401.6886349603404,
-            402.96100125624554,
-            404.2293636694781,
-            405.49375976277514,
-            406.7542265118416,
-            408.0108003215376,
-            409.26351704269155,
-            410.51241196598863,
-            411.75751987583556,
-            412.9988749754987,
-            414.2365110531971,
-            415.4704612737782,
-            416.70075841098856,
-            417.9274346990808,
-            419.15052192739313,
-            420.370051408578,
-            421.5860540146825,
-            422.7985601619284,
-            424.00759984198936,
-            425.21320261272035,
-            426.4153976199673,
-            427.6142135948352,
-            428.8096788724503,
-            430.00182138865557,
-            431.1906686967366,
-            432.37624797510006,
-            433.5585860153996,
-            434.7377092683095,
-            435.91364379693664,
-            437.0864153472734,
-            438.25604930856764,
-            439.422570714835,
-            440.58600426874955,
-            441.7463743965844,
-            443.36663746885824,
-            444.7500062726252,
-            445.8990928931567,
-            446.8160054136371,
-            447.5023741337157,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-        ]
-    ),
-    5,
+# the path to the file with the knots and coefficients of the B-spline
+_SPLINE_ARRAYS_FILE_PATH = os.path.join(
+    os.path.dirname(__file__), "_hermite_largest_extrema_spline.npz"
 )
+
+# the specifications of the B-spline for the largest extrema of the Hermite functions
+HERMITE_LARGEST_EXTREMA_MAX_ORDER = 100176
+with np.load(_SPLINE_ARRAYS_FILE_PATH, allow_pickle=False) as _spline_arrays:
+    HERMITE_LARGEST_EXTREMA_SPLINE_TCK = (
+        _spline_arrays["knots"],
+        _spline_arrays["coefficients"],
+        5,
+    )
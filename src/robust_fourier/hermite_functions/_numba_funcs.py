@@ -11,7 +11,7 @@ imported from the NumPy-based implementation.
 # === Imports ===
 
 from .._utils.numba_helpers import do_numba_normal_jit_action
-from ._numpy_funcs import _hermite_function_basis
+from ._numpy_funcs import _hermite_function_basis, _single_hermite_function
 
 # === Functions ===
 
@@ -33,6 +33,10 @@ try:
         nopython=True,
         cache=True,
     )(_hermite_function_basis)
+    nb_single_hermite_function = jit(
+        nopython=True,
+        cache=True,
+    )(_single_hermite_function)
 
 
 # otherwise, the NumPy-based implementation of the Hermite functions is declared as the
@@ -40,3 +44,4 @@ try:
 except ImportError:  # pragma: no cover
 
     nb_hermite_function_basis = _hermite_function_basis
+    nb_single_hermite_function = _single_hermite_function
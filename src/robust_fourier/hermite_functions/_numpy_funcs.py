@@ -8,12 +8,18 @@ This module provides NumPy-based implementations of the Hermite functions.
 # === Imports ===
 
 from math import ceil as py_ceil
+from math import lgamma as py_lgamma
+from math import log as py_log
 from math import sqrt as py_sqrt
 
 import numpy as np
 from numpy import abs as np_abs
 from numpy import exp, log, sqrt, square
-from scipy.integrate import trapezoid
+
+# === Constants ===
+
+# the logarithm of the machine precision for float64
+_LOG_DOUBLE_EPS = py_log(np.finfo(np.float64).eps)
 
 # === Functions ===
 
@@ -135,6 +141,7 @@ def _single_hermite_function(
     Computes a single Hermite function of order ``n`` at the given points ``x`` by
     making use of a complex integral which is way faster than the recursion if only
     a specific Hermite function is needed.
+    It is written to be compatible with Numba ``jit``-compilation.
 
     The Hermite functions are defined as
 
@@ -187,11 +194,14 @@ def _single_hermite_function(
     # NOTE: we will exploit mirroring later
     integ_points = np.linspace(0.0, np.pi, num_integ_points)
     delta_angle = np.pi / (num_integ_points - 1)
+    integral_scale = delta_angle / np.pi
 
     # then, a correction factor gamma needs to be evaluated from a value k which is
     # sqrt(n / 2)
     k_value = 0.7071067811865476 * sqrt_n
-    log_n_factorial = np.sum(np.log(np.arange(1, max(2, n + 1), 1, np.int64)))
+    # NOTE: log(n!) is obtained from the log-gamma function as log(gamma(n + 1)) which
+    #       is way cheaper than summing up the logarithms of 1 to n
+    log_n_factorial = py_lgamma(n + 1.0)
     log_gamma = (
         0.5 * log_n_factorial
         - 0.5 * n * np.log(2.0)
@@ -202,7 +212,7 @@ def _single_hermite_function(
     # now, all the values of the integrand are evaluated by making use of potentially
     # reduced computations that consider only some angles where the integrand exceeds
     # the machine precision
-    log_eps = np.log(np.finfo(x.dtype).eps)
+    log_eps = _LOG_DOUBLE_EPS
     one_over_sqrt_two_n = 1.0 / np.sqrt(2 * n)
     k_value_squared = k_value * k_value
     # for computing the interval bounds, the intersection of a quadratic cosine
@@ -254,36 +264,43 @@ def _single_hermite_function(
         # [bound_value_right, bound_value_left] for the positive angles
         # NOTE: here, only the positive angles are considered because the target
         #       function's real part can be proven to be symmetric around the y-axis
+        # NOTE: since the integration points are sorted, the points within the bounds
+        #       form a contiguous slice whose ends can be found by a binary search
+        #       instead of masking the whole grid for every x-value
         sub_integ_points = integ_points[
-            np.where(
-                np.logical_and(
-                    integ_points >= bound_value_right,
-                    integ_points <= bound_value_left,
-                )
+            np.searchsorted(integ_points, bound_value_right, side="left") : (
+                np.searchsorted(integ_points, bound_value_left, side="right")
             )
         ]
 
+        # the integral over less than 2 points is zero
+        if sub_integ_points.size < 2:
+            continue
+
         integrand_values_constant_log = log_gamma - 0.5 * np.square(x_value_internal)
         integrand_values_x_prefactor = 2 * x_value_internal * k_value
+        integrand_values = np.exp(
+            -1.0j * n * sub_integ_points
+            + integrand_values_x_prefactor * np.exp(1.0j * sub_integ_points)
+            - k_value_squared * np.exp(2.0j * sub_integ_points)
+            + integrand_values_constant_log
+        ).real
+        # the integral is evaluated with the trapezoidal rule and directly scaled
         # NOTE: the prefactor 2 exploits the symmetry of the target function, so only
-        #       1 side has to be integrated
-        hermite_function[iter_i] = 2.0 * trapezoid(
-            y=np.exp(
-                -1.0j * n * sub_integ_points
-                + integrand_values_x_prefactor * np.exp(1.0j * sub_integ_points)
-                - k_value_squared * np.exp(2.0j * sub_integ_points)
-                + integrand_values_constant_log
-            ).real,
-            dx=delta_angle,
+        #       1 side has to be integrated and together with the normalisation by
+        #       1 / (2 * pi), the scale factor becomes ``delta_angle / pi``
+        # NOTE: besides, the symmetry of the Hermite functions is exploited
+        #       for even orders, the function is symmetric around the y-axis, so nothing
+        #       has to be done
+        #       for odd orders, the function is anti-symmetric around the y-axis, so the
+        #       sign has to be flipped
+        integral_value = integrand_values.sum() - 0.5 * (
+            integrand_values[0] + integrand_values[-1]
         )
-
-        # finally, the symmetry of the Hermite functions is exploited
-        # for even orders, the function is symmetric around the y-axis, so nothing has
-        # to be done
-        # for odd orders, the function is anti-symmetric around the y-axis, so the sign
-        # has to be flipped
         if x_value < 0.0 and n % 2 == 1:
-            hermite_function[iter_i] *= -1.0
+            hermite_function[iter_i] = -integral_scale * integral_value
+        else:
+            hermite_function[iter_i] = integral_scale * integral_value
 
-    # finally, the hermite functions are properly scaled and returned
-    return hermite_function / (2.0 * np.pi)
+    # finally, the Hermite functions are returned
+    return hermite_function
@@ -384,10 +384,12 @@ def test_dilated_hermite_function_basis_orthonormal_and_bounded(
     assert np.allclose(dot_product, np.eye(n + 1), atol=ORTHONORMALITY_TEST_ATOL)
 
 
+@pytest.mark.parametrize("jit", [False, True])
 def test_single_hermite_functions(
     reference_dilated_hermite_function_basis: Generator[
         ReferenceHermiteFunctionBasis, None, None
     ],
+    jit: bool,
 ) -> None:
     """
     This test checks the implementation of the function
@@ -410,6 +412,7 @@ def test_single_hermite_functions(
                 x=reference.x_values,
                 n=n,
                 alpha=reference.alpha,
+                jit=jit,
             )
 
             # the reference values are compared with the numerical results
@@ -418,7 +421,7 @@ def test_single_hermite_functions(
                 reference.hermite_function_basis[::, n],
                 atol=SYMBOLIC_TEST_HERMITE_FUNC_FLOAT64_ATOL,
                 rtol=SYMBOLIC_TEST_HERMITE_FUNC_FLOAT64_RTOL,
-            ), f"For n = {n} and alpha = {reference.alpha}"
+            ), f"For n = {n}, alpha = {reference.alpha}, and {jit=}"
 
 
 @pytest.mark.parametrize("x_center", [None, 0.0, 1.0, 2.0])